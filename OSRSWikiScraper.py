@@ -4,106 +4,601 @@ OSRS Wiki NPC Database Scraper
 Extracts NPC combat data from Infobox Monster templates via MediaWiki API
 """
 
+import argparse
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
+import logging
+import multiprocessing
+import os
 import re
+import sqlite3
+import sys
 import time
-from typing import Dict, List, Optional, Any
-from collections import defaultdict
+import threading
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Iterator
+from collections import Counter, deque
+from itertools import chain, islice
+
+# API responses are decoded straight from the UTF-8 body bytes (response.content), so requests
+# never has to guess a charset or build an intermediate response.text string
+try:
+    import orjson  # Optional: several times faster than json on large API responses and the saved database
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _json_dumps_line(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
 
 # Configuration
 WIKI_API_URL = "https://oldschool.runescape.wiki/api.php"
 USER_AGENT = "PvMPerformanceTracker/1.0 (NPC Database Scraper; Noah.Horbinski@gmail.com)"
 RATE_LIMIT_DELAY = 0.5  # Seconds between requests (be respectful!)
+RATE_LIMIT_MAX_DELAY = 8.0  # Ceiling for the spacing after the wiki starts throttling us
+MAX_CONCURRENT_REQUESTS = 4  # Page fetches allowed in flight at once
+PAGES_PER_REQUEST = 50  # Max titles per query for non-bot API clients
+REQUEST_TIMEOUT = (5, 30)  # Connect/read timeouts in seconds, so a stalled connection can't hang a worker
+CACHE_DB_PATH = 'wiki_cache.db'  # Fetched wiki text, reused while the page revision is unchanged
+JOURNAL_PATH = 'npc_database.jsonl'  # NPCs written as they are extracted, so an interrupted run isn't lost
+
+log = logging.getLogger(__name__)
+
+# Fixed API parameters; requests add their own on top with | so these are never mutated
+_CATEGORY_QUERY = {
+    'action': 'query',
+    'generator': 'categorymembers',
+    'gcmtitle': 'Category:Monsters',
+    'gcmlimit': 500,  # Max allowed
+    'prop': 'info',  # Latest revision id of every member, for checking the page cache
+    'format': 'json',
+    'formatversion': 2
+}
+_PAGES_QUERY = {'action': 'query', 'format': 'json', 'formatversion': 2}
+_REVISION_QUERY = {'prop': 'revisions', 'rvprop': 'ids|content', 'rvslots': 'main'}  # Content under slots.main
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})  # Throttled/overloaded responses, retried and backed off from
+
+# Precompiled wiki text patterns
+_RE_MULTI_INFOBOX = re.compile(r'\{\{Multi Infobox', re.IGNORECASE)
+_RE_INFOBOX_MONSTER = re.compile(r'\{\{Infobox Monster', re.IGNORECASE)
+_RE_TEXT_FIELD = re.compile(r'\|text\d*\s*=\s*([^\n]+)')
+_RE_ITEM_FIELD = re.compile(r'\|item\d*\s*=')
+_RE_KV = re.compile(r'^[ \t]*\|[ \t]*([^=|\s][^=\n|]*?)[ \t]*=([^\n]*)', re.MULTILINE)
+_RE_STRIP = re.compile(r'<ref[^>]*>.*?</ref>|<!--.*?-->', re.DOTALL)  # References and HTML comments
+_RE_WS = re.compile(r'\s+')
+_RE_DIGITS = re.compile(r'\d+')
+_RE_HIT_SPLIT = re.compile(r'<br\s*/?>|,(?!\d{3}(?!\d))', re.IGNORECASE)  # Commas before 3 digits are thousands separators
+_RE_HIT_TOKEN = re.compile(r'(\d[\d,]*)\s*\((?:\[\[([^\]|]+)(?:\|[^\]]*)?\]\]|([^)]+))\)')
+_RE_LINK_STRIP = re.compile(r'\[\[|\]\]')
+
+# Max hit fields, and the attack style an unlabelled value in each one belongs to
+_MAX_HIT_FIELDS = (
+    ('max hit', None),
+    ('maxhit', None),
+    ('max melee', 'melee'),
+    ('max magic', 'magic'),
+    ('max ranged', 'ranged'),
+    ('max mage', 'magic'),
+    ('max range', 'ranged'),
+    ('max crush', 'crush'),
+    ('max slash', 'slash'),
+    ('max stab', 'stab'),
+)
+_MAX_HIT_FIELD_NAMES = frozenset(field for field, _ in _MAX_HIT_FIELDS)
+
+# Max hit labels that map straight to a maxHit key (generic 'melee' depends on the NPC's attack style)
+_ATTACK_NAME_CANONICAL = {
+    'crush': 'crush',
+    'slash': 'slash',
+    'stab': 'stab',
+    'magic': 'magic',
+    'mage': 'magic',
+    'ranged': 'ranged',
+    'range': 'ranged',
+}
+
+# Infobox flag values that mean "yes"
+_TRUTHY = frozenset({'yes', 'true', '1'})
+_IMMUNITY_TRUTHY = _TRUTHY | {'immune'}
+
+# Yes/no attribute flags, in the order they are added to 'attributes'
+_KNOWN_ATTRIBUTES = (
+    'demon', 'dragon', 'undead', 'fiery', 'leafy', 'vampyre',
+    'kalphite', 'shade', 'xerician', 'golem', 'tzhaar'
+)
+_KNOWN_ATTRIBUTE_SET = frozenset(_KNOWN_ATTRIBUTES)
+
+# Immunity field name -> immunity type
+_IMMUNITY_FIELDS = {
+    'immunepoison': 'poison',
+    'immunevenom': 'venom',
+    'immunecannon': 'cannon',
+    'immunethrall': 'thrall',
+    'poison immune': 'poison',
+    'venom immune': 'venom',
+    'cannon immune': 'cannon',
+    'thrall immune': 'thrall',
+}
+
+# NPC output fields in order: (output key, infobox field, parsed as a number)
+# A field of None means the value is computed in extract_npc_data
+_NPC_FIELDS = (
+    ('name', None, False),
+    ('baseName', None, False),
+    ('phase', None, False),
+    ('version', None, False),
+    ('id', 'id', False),  # Can be comma-separated
+    ('combatLevel', 'combat', True),
+    ('hitpoints', 'hitpoints', True),
+    ('size', 'size', True),
+    ('maxHit', None, False),
+    ('minHit', None, False),
+    ('attackSpeed', 'attack speed', True),
+    ('attackStyle', 'attack style', False),
+    ('aggressive', None, False),
+
+    # Poison/Venom properties
+    ('poisonous', None, False),
+    ('venomType', None, False),
+
+    # Attributes (demon, dragon, undead, etc.)
+    ('attributes', None, False),
+
+    # Immunities
+    ('immunities', None, False),
+
+    # Combat stats
+    ('attackLevel', 'att', True),
+    ('strengthLevel', 'str', True),
+    ('defenceLevel', 'def', True),
+    ('magicLevel', 'mage', True),
+    ('rangedLevel', 'range', True),
+
+    # Offensive bonuses
+    ('attackBonus', 'attbns', True),
+    ('strengthBonus', 'strbns', True),
+    ('rangedAttackBonus', 'arange', True),
+    ('rangedStrengthBonus', 'rngbns', True),
+    ('magicAttackBonus', 'amagic', True),
+    ('magicStrengthBonus', 'mbns', True),
+
+    # Defensive bonuses
+    ('stabDefence', 'dstab', True),
+    ('slashDefence', 'dslash', True),
+    ('crushDefence', 'dcrush', True),
+    ('magicDefence', 'dmagic', True),
+    ('rangedDefence', 'drange', True),
+
+    # Ammo-specific defences
+    ('lightAmmoDefence', 'dlight', True),
+    ('standardAmmoDefence', 'dstandard', True),
+    ('heavyAmmoDefence', 'dheavy', True),
+
+    # Elemental weakness
+    ('elementalWeakness', None, False),
+
+    # Slayer info
+    ('slayerLevel', 'slaylvl', True),
+    ('slayerXp', 'slayxp', True),
+
+    # Metadata
+    ('wikiPage', None, False),
+    ('examine', 'examine', False),
+)
+
+# Database key character maps (one str.translate pass instead of chained replaces)
+_ID_KEY_TRANS = str.maketrans({' ': '_', '-': '_'})
+_NAME_KEY_TRANS = str.maketrans({' ': '_', '-': '_', '(': None, ')': None})
+
+# Characters a version number suffix on an infobox key can be made of
+_ASCII_DIGITS = '0123456789'
+
+# Comma separated attribute lists
+_ATTRIBUTE_FIELDS = ('attributes', 'attribute', 'cat')
+
+# Fields whose values are only ever compared case-insensitively
+_FLAG_FIELDS = frozenset(
+    _ATTRIBUTE_FIELDS + _KNOWN_ATTRIBUTES + tuple(_IMMUNITY_FIELDS) + ('aggressive', 'poisonous', 'venom')
+)
+
+
+def _parse_number(value: str) -> Optional[int]:
+    """
+    Parse a number from wiki text, handling ranges and special cases
+    Module-level so the per-field loops can call it without a method lookup
+    """
+    if not value:
+        return None
+
+    # Most fields are a plain number
+    if value.isdecimal():
+        return int(value)
+
+    # Remove commas
+    value = value.replace(',', '')
+
+    # Handle ranges (take the max, i.e. whatever follows the last hyphen or en dash)
+    range_sep = max(value.rfind('-'), value.rfind('–'))
+    if range_sep != -1:
+        try:
+            return int(value[range_sep + 1:].strip())
+        except ValueError:
+            return None
+
+    # Try to extract first number
+    match = _RE_DIGITS.search(value)
+    if match:
+        try:
+            return int(match.group())
+        except ValueError:
+            return None
+
+    return None
+
+
+def _normalize_attack_name(attack_name: str, specific_melee_type: Optional[str]) -> str:
+    """
+    Map a max hit label such as '[[Magic]]' or 'Special / charged' to a maxHit key
+    Generic 'melee' becomes the NPC's specific melee type (crush/slash/stab) when its attack style names one
+    """
+    attack_name = attack_name.strip().lower()
+    if '[' in attack_name or ']' in attack_name:
+        attack_name = _RE_LINK_STRIP.sub('', attack_name)
+
+    # Most labels are exactly one style name
+    canonical = _ATTACK_NAME_CANONICAL.get(attack_name)
+    if canonical:
+        return canonical
+    if 'melee' in attack_name:
+        return specific_melee_type or 'melee'
+    if 'magic' in attack_name or 'mage' in attack_name:
+        return 'magic'
+    if 'range' in attack_name:
+        return 'ranged'
+    if '/' in attack_name:
+        attack_name = attack_name.split('/')[0].strip()
+    return attack_name.replace(' ', '_')
+
+
+class RateLimiter:
+    """
+    Spaces out request start times so concurrent fetches still respect RATE_LIMIT_DELAY
+    Thread-safe: each caller reserves the next free slot and sleeps until it arrives
+    The spacing doubles (up to max_delay) whenever the wiki throttles a request, then eases back to delay as requests succeed
+    """
+    def __init__(self, delay: float, max_delay: float = RATE_LIMIT_MAX_DELAY):
+        self.delay = delay
+        self.min_delay = delay
+        self.max_delay = max(delay, max_delay)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.delay
+
+        if slot > now:
+            time.sleep(slot - now)
+
+    def record(self, throttled: bool):
+        """
+        Adjust the spacing after a response: back off multiplicatively when throttled, otherwise recover gradually
+        """
+        with self._lock:
+            if throttled:
+                self.delay = min(self.max_delay, self.delay * 2)
+            elif self.delay > self.min_delay:
+                self.delay = max(self.min_delay, self.delay * 0.9)
+
+
+class PageCache:
+    """
+    SQLite cache of page wiki text, keyed by title
+    Remembers the revision id each page was fetched at, so a page is only downloaded again after it is edited
+    Wiki text is stored zlib-compressed (it shrinks several times over); uncompressed rows from older caches still load
+    """
+    def __init__(self, path: str):
+        self._lock = threading.Lock()  # Shared by the fetch worker threads
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS pages (title TEXT PRIMARY KEY, revid INTEGER, content TEXT)')
+        self._conn.commit()
+
+    def get_many(self, titles: List[str]) -> Dict[str, Tuple[int, str]]:
+        """
+        Return {title: (revid, wiki_text)} for the titles that are cached
+        """
+        placeholders = ','.join('?' * len(titles))
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT title, revid, content FROM pages WHERE title IN ({placeholders})', titles
+            ).fetchall()
+
+        return {
+            title: (revid, zlib.decompress(content).decode('utf-8') if isinstance(content, bytes) else content)
+            for title, revid, content in rows
+        }
+
+    def put_many(self, pages: Dict[str, Tuple[int, str]]):
+        """
+        Store {title: (revid, wiki_text)}, replacing older revisions
+        """
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO pages (title, revid, content) VALUES (?, ?, ?)',
+                [(title, revid, zlib.compress(content.encode('utf-8'))) for title, (revid, content) in pages.items()]
+            )
+            self._conn.commit()
+
+    def close(self):
+        """
+        Close the database connection
+        """
+        with self._lock:
+            self._conn.close()
+
 
 class OSRSWikiScraper:
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = CACHE_DB_PATH, force_refresh: bool = False,
+                 max_workers: int = MAX_CONCURRENT_REQUESTS, revalidate: bool = True,
+                 journal_path: Optional[str] = None, parse_processes: int = 0):
+        # ACCEPT_ENCODING also offers br/zstd when urllib3 has a decoder installed for them
         self.session = requests.Session()
-        self.session.headers.update({'User-Agent': USER_AGENT})
+        self.session.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING})
+
+        # Keep one pooled keep-alive connection per fetch worker plus one for the category listing prefetch,
+        # and retry throttled/failed requests
+        # (Retry-After on 429/503 is honoured; once retries run out the last response is returned, so
+        # _api_get can still back the rate limiter off before raising instead of parsing an error page)
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=_RETRY_STATUSES,
+                      allowed_methods=frozenset({'GET'}), respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers + 1, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.rate_limiter = RateLimiter(RATE_LIMIT_DELAY)
+        self.max_workers = max_workers
         self.npcs = {}
 
+        # Worker processes that parse fetched pages in scrape_all_npcs (0 parses on the calling thread)
+        self.parse_processes = parse_processes
+        self._parse_pool = None
+
+        # Each stored NPC is also appended to this JSON Lines file during scrape_all_npcs
+        self.journal_path = journal_path
+        self._journal = None
+
+        # Fetched wiki text is kept on disk between runs; force_refresh ignores it and re-downloads,
+        # revalidate=False trusts it without checking for newer revisions
+        self.cache = PageCache(cache_path) if cache_path else None
+        self.force_refresh = force_refresh
+        self.revalidate = revalidate
+        self._listed_revids: Dict[str, int] = {}  # Latest revision ids seen in the category listing
+
+        # Parsed infoboxes by wiki text digest, so pages with identical wiki text are only parsed once
+        self._infobox_cache: Dict[bytes, List[Dict[str, Any]]] = {}
+
+    def close(self):
+        """
+        Release the pooled HTTP connections and the page cache once the scraper is done fetching
+        """
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
     def get_all_npc_pages(self) -> List[str]:
         """
         Get all pages in the 'Monsters' category
         """
-        print("Fetching list of all NPC pages...")
+        log.info("Fetching list of all NPC pages...")
 
-        pages = []
-        continue_token = None
+        pages = list(self.iter_npc_pages())
 
-        while True:
-            params = {
-                'action': 'query',
-                'list': 'categorymembers',
-                'cmtitle': 'Category:Monsters',
-                'cmlimit': 500,  # Max allowed
-                'format': 'json'
-            }
+        log.info("Found %s NPC pages", len(pages))
+        return pages
 
-            if continue_token:
-                params['cmcontinue'] = continue_token
+    def iter_npc_pages(self) -> Iterator[str]:
+        """
+        Yield the titles in the 'Monsters' category as each listing page arrives
+        The next listing page is requested in the background while the caller handles the current one
+        """
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            future = prefetcher.submit(self._fetch_category_page, None)
 
-            response = self.session.get(WIKI_API_URL, params=params)
-            data = response.json()
+            while future is not None:
+                data = future.result()
 
-            if 'query' in data and 'categorymembers' in data['query']:
-                for page in data['query']['categorymembers']:
-                    pages.append(page['title'])
+                # Start on the next page before handing this one's titles to the caller
+                if 'continue' in data:
+                    future = prefetcher.submit(self._fetch_category_page, data['continue'])
+                else:
+                    future = None
+
+                if 'query' in data and 'pages' in data['query']:
+                    pages = data['query']['pages']
+                    # Remember each member's latest revision so cached copies can be checked without another query
+                    self._listed_revids.update(
+                        (page['title'], page['lastrevid']) for page in pages if 'lastrevid' in page
+                    )
+                    for page in pages:
+                        yield page['title']
+
+    def _fetch_category_page(self, continue_params: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Fetch one page of the 'Monsters' category listing, with each member's latest revision id
+        """
+        params = _CATEGORY_QUERY | continue_params if continue_params else _CATEGORY_QUERY
+        return self._api_get(params)
 
-            # Check if there are more results
-            if 'continue' in data:
-                continue_token = data['continue']['cmcontinue']
-                time.sleep(RATE_LIMIT_DELAY)
-            else:
-                break
+    def _api_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one rate-limited API request and decode its JSON response
+        Responses that were (or still are) throttled, including ones urllib3 retried internally, slow the rate limiter down
+        before a final 429/5xx is raised as an HTTPError
+        """
+        self.rate_limiter.wait()
+        response = self.session.get(WIKI_API_URL, params=params, timeout=REQUEST_TIMEOUT)
 
-        print(f"Found {len(pages)} NPC pages")
-        return pages
+        retries = getattr(response.raw, 'retries', None)
+        throttled = response.status_code in _RETRY_STATUSES or bool(
+            retries and any(entry.status in _RETRY_STATUSES for entry in retries.history)
+        )
+        self.rate_limiter.record(throttled)
+
+        response.raise_for_status()
+        return _json_loads(response.content)
 
     def get_page_content(self, page_title: str) -> Optional[str]:
         """
         Get the raw wiki text for a specific page
         """
-        params = {
-            'action': 'query',
-            'prop': 'revisions',
-            'rvprop': 'content',
-            'titles': page_title,
-            'format': 'json',
-            'formatversion': 2
-        }
+        return self.get_pages_content([page_title]).get(page_title)
+
+    def get_pages_content(self, titles: List[str]) -> Dict[str, str]:
+        """
+        Get the raw wiki text for several pages, PAGES_PER_REQUEST titles per API call
+        Pages whose cached revision is still current (or any cached page, without revalidation) are served from the page cache
+        Returns {title: wiki_text}; missing pages are left out
+        """
+        contents = {}
+
+        for start in range(0, len(titles), PAGES_PER_REQUEST):
+            chunk = titles[start:start + PAGES_PER_REQUEST]
+
+            cached = {}
+            if self.cache is not None and not self.force_refresh:
+                cached = self.cache.get_many(chunk)
+
+            if cached and not self.revalidate:
+                contents.update((title, wiki_text) for title, (revid, wiki_text) in cached.items())
+            elif cached:
+                # The category listing already reported most latest revision ids; one lightweight
+                # revision id query covers the rest (e.g. test pages)
+                latest = {title: self._listed_revids.get(title) for title in cached}
+                unlisted = [title for title, revid in latest.items() if revid is None]
+                if unlisted:
+                    for title, page in self._query_pages(unlisted, {'prop': 'info'}).items():
+                        latest[title] = page.get('lastrevid')
+
+                for title, (revid, wiki_text) in cached.items():
+                    if latest.get(title) == revid:
+                        contents[title] = wiki_text
+
+            stale = [title for title in chunk if title not in contents]
+            if not stale:
+                continue
+
+            fetched = {}
+            for title, page in self._query_pages(stale, _REVISION_QUERY).items():
+                try:
+                    revision = page['revisions'][0]
+                    wiki_text = revision['slots']['main']['content']
+                except (KeyError, IndexError):
+                    continue  # Missing or invalid page
+
+                fetched[title] = (revision['revid'], wiki_text)
+                contents[title] = wiki_text
+
+            if self.cache is not None and fetched:
+                self.cache.put_many(fetched)
+
+        return contents
+
+    def _query_pages(self, titles: List[str], params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run a prop query for up to PAGES_PER_REQUEST titles
+        Returns {title: page}, merged across continuation responses
+        Titles the API normalized (e.g. 'zulrah' -> 'Zulrah') are also listed under the title as requested
+        """
+        params = _PAGES_QUERY | {'titles': '|'.join(titles)} | params
+        pages = {}
+        normalized = []
 
-        response = self.session.get(WIKI_API_URL, params=params)
-        data = response.json()
+        while True:
+            data = self._api_get(params)
 
-        if 'query' in data and 'pages' in data['query']:
-            page = data['query']['pages'][0]
-            if 'revisions' in page and len(page['revisions']) > 0:
-                return page['revisions'][0]['content']
+            if 'query' in data and 'pages' in data['query']:
+                for page in data['query']['pages']:
+                    pages.setdefault(page['title'], {}).update(page)
+                normalized.extend(data['query'].get('normalized', ()))
 
-        return None
+            # Big batches can hit the API's response size cap; the remaining
+            # revisions are then returned by continuation requests
+            if 'continue' in data:
+                params.update(data['continue'])
+            else:
+                break
+
+        # A batch only answers with canonical titles, so map them back to what the caller asked for
+        for entry in normalized:
+            if entry['to'] in pages:
+                pages[entry['from']] = pages[entry['to']]
+
+        return pages
 
     def find_matching_brace(self, text: str, start_pos: int) -> int:
         """
         Find the matching closing braces for an opening {{
         Returns the position of the matching }}
+        Jumps between brace tokens with str.find; braces inside <!-- --> or <nowiki> are ignored
         """
+        find = text.find  # Bound once; called several times per brace token
+        has_unparsed = '<!--' in text or '<nowiki>' in text
         depth = 0
         i = start_pos
+        close_pos = -1
 
-        while i < len(text) - 1:
-            if text[i:i+2] == '{{':
+        while True:
+            # The next }} stays valid while only {{ tokens are consumed, so it is only searched for again once passed
+            if close_pos < i:
+                close_pos = find('}}', i)
+                if close_pos == -1:
+                    return -1
+
+            open_pos = find('{{', i, close_pos)
+            token_pos = close_pos if open_pos == -1 else open_pos
+
+            # Skip comments/nowiki that start before the next brace token
+            if has_unparsed:
+                comment_pos = find('<!--', i, token_pos)
+                nowiki_pos = find('<nowiki>', i, token_pos)
+            else:
+                comment_pos = nowiki_pos = -1
+            if comment_pos != -1 and (nowiki_pos == -1 or comment_pos < nowiki_pos):
+                span_end = find('-->', comment_pos + 4)
+                if span_end == -1:
+                    return -1
+                i = span_end + 3
+                continue
+            if nowiki_pos != -1:
+                span_end = find('</nowiki>', nowiki_pos + 8)
+                if span_end == -1:
+                    return -1
+                i = span_end + 9
+                continue
+
+            if open_pos != -1:
                 depth += 1
-                i += 2
-            elif text[i:i+2] == '}}':
+                i = open_pos + 2
+            else:
                 depth -= 1
                 if depth == 0:
-                    return i
-                i += 2
-            else:
-                i += 1
-
-        return -1
+                    return close_pos
+                i = close_pos + 2
 
     def parse_infobox_monster(self, wiki_text: str) -> List[Dict[str, Any]]:
         """
@@ -115,17 +610,22 @@ class OSRSWikiScraper:
         2. Standalone {{Infobox Monster}} with multiple versions (e.g., Zulrah)
         3. Multiple standalone {{Infobox Monster}} templates (e.g., bosses with separate forms)
         """
+        # Quick check before any regex work: nav pages, disambiguations and redirects have no infobox.
+        # MediaWiki only folds the case of the first letter, so these two spellings cover every transclusion.
+        if 'nfobox Monster' not in wiki_text and 'nfobox monster' not in wiki_text:
+            log.debug("No Infobox Monster in %s characters of wiki text", len(wiki_text))
+            return []
+
         infoboxes = []
 
-        print(f"  [DEBUG] Wiki text length: {len(wiki_text)} characters")
-        print(f"  [DEBUG] First 500 chars: {wiki_text[:500]}")
+        log.debug("Wiki text length: %s characters", len(wiki_text))
+        log.debug("First 500 chars: %.500s", wiki_text)
 
         # First, try to find Multi Infobox structure
-        multi_infobox_pattern = r'\{\{Multi Infobox'
-        multi_match = re.search(multi_infobox_pattern, wiki_text, re.IGNORECASE)
+        multi_match = _RE_MULTI_INFOBOX.search(wiki_text)
 
         if multi_match:
-            print(f"  [DEBUG] Found Multi Infobox at position {multi_match.start()}")
+            log.debug("Found Multi Infobox at position %s", multi_match.start())
 
             # Find the matching closing braces
             start_pos = multi_match.start()
@@ -133,52 +633,46 @@ class OSRSWikiScraper:
 
             if end_pos != -1:
                 multi_content = wiki_text[multi_match.end():end_pos]
-                print(f"  [DEBUG] Multi Infobox content length: {len(multi_content)}")
-                print(f"  [DEBUG] First 300 chars of multi content: {multi_content[:300]}")
+                log.debug("Multi Infobox content length: %s", len(multi_content))
+                log.debug("First 300 chars of multi content: %.300s", multi_content)
 
                 # Find all text/item pairs
-                text_pattern = re.compile(r'\|text\d*\s*=\s*([^\n]+)')
-                item_pattern = re.compile(r'\|item\d*\s*=')
-
-                text_matches = list(text_pattern.finditer(multi_content))
-                item_matches = list(item_pattern.finditer(multi_content))
+                text_matches = list(_RE_TEXT_FIELD.finditer(multi_content))
+                item_matches = list(_RE_ITEM_FIELD.finditer(multi_content))
 
-                print(f"  [DEBUG] Found {len(text_matches)} text labels and {len(item_matches)} items")
+                log.debug("Found %s text labels and %s items", len(text_matches), len(item_matches))
 
                 # For each item marker, find the corresponding Infobox Monster
+                # Both match lists are in position order, so one pointer tracks the text labels seen so far
+                text_count = len(text_matches)
+                next_text = 0
                 for i, item_match in enumerate(item_matches):
                     item_start = item_match.end()
 
-                    # Find corresponding text label (should be before this item)
-                    text_label = None
-                    for text_match in reversed(text_matches):
-                        if text_match.start() < item_match.start():
-                            text_label = text_match.group(1).strip()
-                            break
+                    # Find corresponding text label (the last one before this item)
+                    while next_text < text_count and text_matches[next_text].start() < item_match.start():
+                        next_text += 1
+                    text_label = text_matches[next_text - 1].group(1).strip() if next_text else None
 
-                    print(f"  [DEBUG] Item {i} has label: {text_label}")
+                    log.debug("Item %s has label: %s", i, text_label)
 
                     # Find the next item or text marker (to know where this infobox ends)
                     next_marker_pos = len(multi_content)
                     if i + 1 < len(item_matches):
                         next_marker_pos = item_matches[i + 1].start()
-                    elif i < len(text_matches) - 1:
-                        # Check if there's a text marker after this
-                        for text_match in text_matches:
-                            if text_match.start() > item_match.start():
-                                next_marker_pos = text_match.start()
-                                break
+                    elif i < text_count - 1 and next_text < text_count:
+                        # The first text marker after this item
+                        next_marker_pos = text_matches[next_text].start()
 
                     # Extract content between this item and the next marker
                     section = multi_content[item_start:next_marker_pos]
-                    print(f"  [DEBUG] Section length: {len(section)}, first 200 chars: {section[:200]}")
+                    log.debug("Section length: %s, first 200 chars: %.200s", len(section), section)
 
                     # Find {{Infobox Monster...}} in this section
-                    infobox_pattern = r'\{\{Infobox Monster'
-                    infobox_match = re.search(infobox_pattern, section, re.IGNORECASE)
+                    infobox_match = _RE_INFOBOX_MONSTER.search(section)
 
                     if infobox_match:
-                        print(f"  [DEBUG] Found Infobox Monster in item {i}")
+                        log.debug("Found Infobox Monster in item %s", i)
 
                         # Find matching closing braces for this infobox
                         infobox_start = infobox_match.start()
@@ -186,36 +680,34 @@ class OSRSWikiScraper:
 
                         if infobox_end != -1:
                             infobox_content = section[infobox_match.end():infobox_end]
-                            print(f"  [DEBUG] Infobox content length: {len(infobox_content)}")
+                            log.debug("Infobox content length: %s", len(infobox_content))
 
                             infobox_data = self.parse_infobox_content(infobox_content, phase_label=text_label)
                             if infobox_data:
                                 infoboxes.append(infobox_data)
-                                print(f"  [DEBUG] Successfully parsed infobox {i}")
+                                log.debug("Successfully parsed infobox %s", i)
                         else:
-                            print(f"  [DEBUG] Could not find closing braces for infobox {i}")
+                            log.debug("Could not find closing braces for infobox %s", i)
                     else:
-                        print(f"  [DEBUG] No Infobox Monster found in item {i}")
+                        log.debug("No Infobox Monster found in item %s", i)
             else:
-                print(f"  [DEBUG] Could not find closing braces for Multi Infobox")
+                log.debug("Could not find closing braces for Multi Infobox")
 
         # Also check for standalone Infobox Monster (not in Multi Infobox)
         if not multi_match:
-            print(f"  [DEBUG] No Multi Infobox found, looking for standalone Infobox Monster")
-
-            standalone_pattern = r'\{\{Infobox Monster'
+            log.debug("No Multi Infobox found, looking for standalone Infobox Monster")
 
             pos = 0
             while True:
-                match = re.search(standalone_pattern, wiki_text[pos:], re.IGNORECASE)
+                # Search from pos in place; slicing would copy the rest of the page each time
+                match = _RE_INFOBOX_MONSTER.search(wiki_text, pos)
                 if not match:
                     break
 
-                # Calculate absolute positions
-                match_start_absolute = pos + match.start()  # Where {{ starts in full text
-                match_end_absolute = pos + match.end()      # Where pattern ends in full text
+                match_start_absolute = match.start()  # Where {{ starts in full text
+                match_end_absolute = match.end()      # Where pattern ends in full text
 
-                print(f"  [DEBUG] Found standalone Infobox Monster at position {match_start_absolute}")
+                log.debug("Found standalone Infobox Monster at position %s", match_start_absolute)
 
                 # Find matching closing braces (using absolute position)
                 end_pos = self.find_matching_brace(wiki_text, match_start_absolute)
@@ -223,20 +715,20 @@ class OSRSWikiScraper:
                 if end_pos != -1:
                     # Extract content from end of pattern to closing brace
                     infobox_content = wiki_text[match_end_absolute:end_pos]
-                    print(f"  [DEBUG] Standalone infobox content length: {len(infobox_content)}")
-                    print(f"  [DEBUG] First 200 chars: {repr(infobox_content[:200])}")
+                    log.debug("Standalone infobox content length: %s", len(infobox_content))
+                    log.debug("First 200 chars: %.200r", infobox_content)
 
                     infobox_data = self.parse_infobox_content(infobox_content)
                     if infobox_data:
                         infoboxes.append(infobox_data)
-                        print(f"  [DEBUG] Successfully parsed standalone infobox")
+                        log.debug("Successfully parsed standalone infobox")
 
                     pos = end_pos + 2
                 else:
-                    print(f"  [DEBUG] Could not find closing braces for standalone infobox")
+                    log.debug("Could not find closing braces for standalone infobox")
                     break
 
-        print(f"  [DEBUG] Total infoboxes parsed: {len(infoboxes)}")
+        log.debug("Total infoboxes parsed: %s", len(infoboxes))
         return infoboxes
 
     def parse_infobox_content(self, infobox_content: str, phase_label: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -246,40 +738,35 @@ class OSRSWikiScraper:
         Returns dict with version info included
         """
         data = {'versions': [], 'phaseLabel': phase_label}
+        debug = log.isEnabledFor(logging.DEBUG)
 
-        # Parse key-value pairs
-        raw_data = {}
-        lines = infobox_content.split('\n')
-        print(f"    [DEBUG] Total lines to parse: {len(lines)}")
-        print(f"    [DEBUG] First 5 lines: {lines[:5]}")
+        # Parse "|key = value" lines in a single regex pass (keys are lowercased, and interned since the
+        # same few dozen field names recur in every infobox kept in the parse cache)
+        raw_data = {sys.intern(m.group(1).lower()): m.group(2).strip() for m in _RE_KV.finditer(infobox_content)}
 
-        for line in lines:
-            line = line.strip()
-            if line.startswith('|'):
-                line = line[1:].strip()
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    raw_data[key] = value
+        log.debug("Parsed %s key-value pairs from infobox", len(raw_data))
 
-                    # Debug: print version-related keys as we find them
-                    if 'version' in key or 'max hit' in key:
-                        print(f"    [DEBUG] Found key: '{key}' = '{value[:50]}...'")
+        # Clean each value once; shared fields would otherwise be re-cleaned for every version
+        clean = self.clean_wiki_text
+        cleaned_data = {key: clean(value) for key, value in raw_data.items()}
 
-        print(f"    [DEBUG] Parsed {len(raw_data)} key-value pairs from infobox")
+        if debug:
+            # Show version-related keys
+            for key, value in raw_data.items():
+                if 'version' in key or 'max hit' in key:
+                    log.debug("Found key: '%s' = '%.50s...'", key, value)
 
-        # Show some sample keys
-        sample_keys = list(raw_data.keys())[:15]
-        print(f"    [DEBUG] First 15 keys: {sample_keys}")
+            # Show some sample keys
+            sample_keys = list(raw_data.keys())[:15]
+            log.debug("First 15 keys: %s", sample_keys)
 
-        # Check specifically for version keys
-        version_keys = [k for k in raw_data.keys() if k.startswith('version')]
-        print(f"    [DEBUG] Version-related keys found: {version_keys}")
+            # Check specifically for version keys
+            version_keys = [k for k in raw_data.keys() if k.startswith('version')]
+            log.debug("Version-related keys found: %s", version_keys)
 
         # Check if this infobox has multiple versions by looking for version1, version2, etc.
         has_versions = any(k.startswith('version') and len(k) > 7 and k[7:].isdigit() for k in raw_data.keys())
-        print(f"    [DEBUG] Has versions: {has_versions}")
+        log.debug("Has versions: %s", has_versions)
 
         if has_versions:
             # Find how many versions there are by looking for version1, version2, etc.
@@ -289,7 +776,33 @@ class OSRSWikiScraper:
                     version_num = int(key[7:])
                     version_numbers.add(version_num)
 
-            print(f"    [DEBUG] Version numbers found: {sorted(version_numbers)}")
+            if debug:
+                log.debug("Version numbers found: %s", sorted(version_numbers))
+
+            # Classify every key once: a field of each version whose number its digit suffix ends with
+            # (e.g. 'max hit2' -> 'max hit' for version 2), or shared by all versions when it names none.
+            # Entries keep their key position so a later key still wins when shared and versioned fields collide
+            shared_fields = {}
+            version_fields = {version_num: {} for version_num in version_numbers}
+            for position, (key, cleaned_value) in enumerate(cleaned_data.items()):
+                suffix_digits = len(key) - len(key.rstrip(_ASCII_DIGITS))
+                versioned = False
+
+                for suffix_length in range(1, suffix_digits + 1):
+                    suffix = key[-suffix_length:]
+                    if suffix[0] == '0' and suffix_length > 1:
+                        continue  # Never the string form of a version number
+                    version_num = int(suffix)
+                    if version_num not in version_fields:
+                        continue
+
+                    versioned = True
+                    # Skip the version name keys themselves
+                    if key != f'version{suffix}' and key != f'bucketname{suffix}':
+                        version_fields[version_num][sys.intern(key[:-suffix_length])] = (position, cleaned_value)
+
+                if not versioned:
+                    shared_fields[key] = (position, cleaned_value)
 
             # Extract data for each version
             for version_num in sorted(version_numbers):
@@ -298,43 +811,26 @@ class OSRSWikiScraper:
                 version_data['versionName'] = raw_data.get(f'version{version_num}', f'Version {version_num}')
                 version_data['bucketName'] = raw_data.get(f'bucketname{version_num}', version_data['versionName'])
 
-                # Extract version-specific fields
-                for key, value in raw_data.items():
-                    # Skip the version name keys themselves
-                    if key == f'version{version_num}' or key == f'bucketname{version_num}':
-                        continue
+                fields = dict(shared_fields)
+                for base_key, entry in version_fields[version_num].items():
+                    if base_key not in fields or fields[base_key][0] < entry[0]:
+                        fields[base_key] = entry
+                version_data.update((key, cleaned_value) for key, (_, cleaned_value) in fields.items())
 
-                    # Check if this key ends with the version number
-                    if key.endswith(str(version_num)):
-                        # Remove the version number suffix
-                        base_key = key[:-len(str(version_num))]
-                        cleaned_value = self.clean_wiki_text(value)
-                        version_data[base_key] = cleaned_value
-                        print(f"    [DEBUG] Version {version_num}: '{key}' -> '{base_key}' = '{cleaned_value[:30]}...'")
-                    # Check if this is a shared field (no version number suffix)
-                    elif not any(key.endswith(str(v)) for v in version_numbers):
-                        # This is a shared field (no version number)
-                        cleaned_value = self.clean_wiki_text(value)
-                        version_data[key] = cleaned_value
-
-                print(f"    [DEBUG] Version {version_num} ('{version_data['versionName']}') has {len(version_data)} fields")
+                log.debug("Version %s ('%s') has %s fields", version_num, version_data['versionName'], len(version_data))
 
                 # Debug: show attack style and max hit for this version
-                if 'attack style' in version_data:
-                    print(f"    [DEBUG] Version {version_num} attack style: '{version_data['attack style']}'")
-                if 'max hit' in version_data:
-                    print(f"    [DEBUG] Version {version_num} max hit: '{version_data['max hit']}'")
+                if debug:
+                    log.debug("Version %s attack style: '%s'", version_num, version_data.get('attack style'))
+                    log.debug("Version %s max hit: '%s'", version_num, version_data.get('max hit'))
 
                 data['versions'].append(version_data)
         else:
             # Single version, use all data as-is
-            version_data = {}
-            for key, value in raw_data.items():
-                cleaned_value = self.clean_wiki_text(value)
-                version_data[key] = cleaned_value
+            version_data = dict(cleaned_data)
             version_data['versionNumber'] = 1
             version_data['versionName'] = version_data.get('name', 'Default')
-            print(f"    [DEBUG] Single version with {len(version_data)} fields")
+            log.debug("Single version with %s fields", len(version_data))
             data['versions'].append(version_data)
 
         return data if data['versions'] else None
@@ -344,11 +840,9 @@ class OSRSWikiScraper:
         """
         Remove wiki markup from text
         """
-        # Remove references like <ref>...</ref>
-        text = re.sub(r'<ref[^>]*>.*?</ref>', '', text, flags=re.DOTALL)
-
-        # Remove HTML comments
-        text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
+        # Remove references like <ref>...</ref> and HTML comments in one pass
+        if '<' in text:
+            text = _RE_STRIP.sub('', text)
 
         # Remove wiki links [[link|text]] -> text (but keep the link text for max hit parsing)
         # DON'T remove the [[ ]] from max hit values yet - we need them for parsing
@@ -360,8 +854,11 @@ class OSRSWikiScraper:
         # Remove templates like {{template}} - but be careful not to remove content
         # text = re.sub(r'\{\{[^}]*\}\}', '', text)
 
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Remove extra whitespace (every whitespace character except a plain space is non-printable,
+        # so most values can skip the regex and only need stripping)
+        if '  ' in text or not text.isprintable():
+            text = _RE_WS.sub(' ', text)
+        text = text.strip()
 
         return text
 
@@ -369,29 +866,7 @@ class OSRSWikiScraper:
         """
         Parse a number from wiki text, handling ranges and special cases
         """
-        if not value:
-            return None
-
-        # Remove commas
-        value = value.replace(',', '')
-
-        # Handle ranges (take the max)
-        if '–' in value or '-' in value:
-            parts = re.split(r'[–-]', value)
-            try:
-                return int(parts[-1].strip())
-            except ValueError:
-                return None
-
-        # Try to extract first number
-        match = re.search(r'\d+', value)
-        if match:
-            try:
-                return int(match.group())
-            except ValueError:
-                return None
-
-        return None
+        return _parse_number(value)
 
     def parse_max_hit(self, infobox_data: Dict[str, str]) -> Dict[str, int]:
         """
@@ -402,11 +877,15 @@ class OSRSWikiScraper:
         """
         max_hits = {}
 
+        # Versions without any max hit field need none of the attack style analysis below
+        if _MAX_HIT_FIELD_NAMES.isdisjoint(infobox_data):
+            return max_hits
+
         # Get attack styles for this NPC
         attack_style = infobox_data.get('attack style', '').lower()
         has_attack_style = bool(attack_style.strip())
 
-        print(f"    [DEBUG] Attack style for max hit parsing: '{attack_style}'")
+        log.debug("Attack style for max hit parsing: '%s'", attack_style)
 
         # Determine the specific melee type if present
         specific_melee_type = None
@@ -417,230 +896,107 @@ class OSRSWikiScraper:
         elif 'stab' in attack_style:
             specific_melee_type = 'stab'
 
-        print(f"    [DEBUG] Specific melee type detected: {specific_melee_type}")
-
-        # Check for different max hit fields
-        fields_to_check = [
-            ('max hit', None),
-            ('maxhit', None),
-            ('max melee', 'melee'),
-            ('max magic', 'magic'),
-            ('max ranged', 'ranged'),
-            ('max mage', 'magic'),
-            ('max range', 'ranged'),
-            ('max crush', 'crush'),
-            ('max slash', 'slash'),
-            ('max stab', 'stab'),
-        ]
-
-        for field_name, attack_type in fields_to_check:
-            if field_name in infobox_data:
-                value = infobox_data[field_name]
-
-                print(f"    [DEBUG] Found field '{field_name}' = '{value[:100]}...'")
-
-                # Check if this contains <br/> or <br> - indicates multiple max hits
-                if '<br' in value.lower():
-                    # Split by <br/> or <br>
-                    parts = re.split(r'<br\s*/?>',  value, flags=re.IGNORECASE)
-
-                    base_max_hit = None
-
-                    for part in parts:
-                        part = part.strip()
-                        if not part:
-                            continue
-
-                        match = re.search(r'(\d+)\s*(?:\(([^)]+)\))?', part)
-                        if match:
-                            hit_value = int(match.group(1))
-                            attack_name = match.group(2)
-
-                            if attack_name:
-                                attack_name = attack_name.strip().lower()
-                                attack_name = re.sub(r'\[\[|\]\]', '', attack_name)
-
-                                # Standardize attack names but preserve specific melee types
-                                if attack_name in ['crush', 'slash', 'stab']:
-                                    # Keep specific melee type
-                                    pass
-                                elif 'melee' in attack_name:
-                                    # If max hit says 'melee' but attack style has specific type, use that
-                                    if specific_melee_type:
-                                        attack_name = specific_melee_type
-                                    else:
-                                        attack_name = 'melee'
-                                elif 'magic' in attack_name or 'mage' in attack_name:
-                                    attack_name = 'magic'
-                                elif 'ranged' in attack_name or 'range' in attack_name:
-                                    attack_name = 'ranged'
-                                elif '/' in attack_name:
-                                    attack_name = attack_name.split('/')[0].strip().replace(' ', '_')
-                                else:
-                                    attack_name = attack_name.replace(' ', '_')
-
-                                max_hits[attack_name] = hit_value
-                            else:
-                                base_max_hit = hit_value
-
-                    if base_max_hit is not None:
-                        if has_attack_style and 'typeless' not in attack_style:
-                            # Apply to specific attack styles based on what's in attack_style
-                            if specific_melee_type:
-                                max_hits.setdefault(specific_melee_type, base_max_hit)
-                            elif 'melee' in attack_style:
-                                max_hits.setdefault('melee', base_max_hit)
-
-                            if 'magic' in attack_style or 'mage' in attack_style:
-                                max_hits.setdefault('magic', base_max_hit)
-                            if 'ranged' in attack_style or 'range' in attack_style:
-                                max_hits.setdefault('ranged', base_max_hit)
-                        else:
-                            max_hits.setdefault('typeless', base_max_hit)
-
-                # Check if this is a complex format with multiple attacks separated by commas
-                elif '[[' in value or '),' in value:
-                    print(f"    [DEBUG] Parsing complex format...")
-                    parts = value.split(',')
-
-                    for part in parts:
-                        part = part.strip()
-                        print(f"      [DEBUG] Parsing part: '{part}'")
-
-                        # Extract number and attack type
-                        match = re.search(r'(\d+)\s*(?:\(\[\[([^\]]+)\]\]\)|\(([^)]+)\))', part)
-
-                        if match:
-                            hit_value = int(match.group(1))
-                            attack_name = match.group(2) or match.group(3)
-
-                            print(f"        [DEBUG] Matched: hit_value={hit_value}, attack_name={attack_name}")
-
-                            # Clean up attack name
-                            attack_name = attack_name.strip().lower()
-                            attack_name = re.sub(r'\[\[|\]\]', '', attack_name)
-
-                            # Standardize attack names but preserve specific melee types
-                            if attack_name in ['crush', 'slash', 'stab']:
-                                # Keep specific melee type
-                                pass
-                            elif 'melee' in attack_name:
-                                # AUTO-CORRECT: If max hit says 'melee' but attack style has specific type, use that
-                                if specific_melee_type:
-                                    print(f"        [DEBUG] Auto-correcting 'melee' to '{specific_melee_type}' based on attack style")
-                                    attack_name = specific_melee_type
-                                else:
-                                    attack_name = 'melee'
-                            elif 'magic' in attack_name or 'mage' in attack_name:
-                                attack_name = 'magic'
-                            elif 'ranged' in attack_name or 'range' in attack_name:
-                                attack_name = 'ranged'
-                            elif '/' in attack_name:
-                                attack_name = attack_name.split('/')[0].strip().replace(' ', '_')
-                            else:
-                                attack_name = attack_name.replace(' ', '_')
-
-                            max_hits[attack_name] = hit_value
-                            print(f"        [DEBUG] Added: {attack_name} = {hit_value}")
-                        else:
-                            print(f"        [DEBUG] No match for part: '{part}'")
-                            num_match = re.search(r'(\d+)', part)
-                            if num_match and not max_hits:
-                                hit_value = int(num_match.group(1))
-                                if has_attack_style and 'typeless' not in attack_style:
-                                    # Apply to specific attack styles
-                                    if specific_melee_type:
-                                        max_hits.setdefault(specific_melee_type, hit_value)
-                                    elif 'melee' in attack_style:
-                                        max_hits.setdefault('melee', hit_value)
-
-                                    if 'magic' in attack_style or 'mage' in attack_style:
-                                        max_hits.setdefault('magic', hit_value)
-                                    if 'ranged' in attack_style or 'range' in attack_style:
-                                        max_hits.setdefault('ranged', hit_value)
-                                else:
-                                    max_hits['typeless'] = hit_value
-                else:
-                    # Simple format, just a number
-                    hit_value = self.parse_number(value)
-                    if hit_value is not None:
-                        if has_attack_style and 'typeless' not in attack_style:
-                            # Apply to specific attack styles from attack_style field
-                            if specific_melee_type:
-                                max_hits[specific_melee_type] = hit_value
-                            elif 'melee' in attack_style:
-                                max_hits['melee'] = hit_value
-
-                            if 'magic' in attack_style or 'mage' in attack_style:
-                                max_hits['magic'] = hit_value
-                            if 'ranged' in attack_style or 'range' in attack_style:
-                                max_hits['ranged'] = hit_value
-
-                            # For specific style fields, also add the specific style
-                            if attack_type:
-                                max_hits[attack_type] = hit_value
-                        else:
-                            # Typeless or no attack style
-                            if 'typeless' in attack_style:
-                                max_hits['typeless'] = hit_value
-                            else:
-                                max_hits['default'] = hit_value
-
-        # Final cleanup
-        if 'default' in max_hits and has_attack_style and 'typeless' not in attack_style and len(max_hits) > 1:
-            default_val = max_hits['default']
-            del max_hits['default']
-
-            # Apply to specific attack styles
-            if specific_melee_type:
-                max_hits.setdefault(specific_melee_type, default_val)
-            elif 'melee' in attack_style:
-                max_hits.setdefault('melee', default_val)
-
-            if 'magic' in attack_style or 'mage' in attack_style:
-                max_hits.setdefault('magic', default_val)
-            if 'ranged' in attack_style or 'range' in attack_style:
-                max_hits.setdefault('ranged', default_val)
+        log.debug("Specific melee type detected: %s", specific_melee_type)
+
+        # Scan the attack style once; the branches below reuse these flags
+        is_melee = 'melee' in attack_style
+        is_magic = 'magic' in attack_style or 'mage' in attack_style
+        is_ranged = 'range' in attack_style  # Also matches 'ranged'
+        is_typeless = 'typeless' in attack_style
+        uses_attack_style = has_attack_style and not is_typeless
+
+        for field_name, attack_type in _MAX_HIT_FIELDS:
+            value = infobox_data.get(field_name)
+            if not value:
+                continue
+
+            log.debug("Found field '%s' = '%.100s...'", field_name, value)
+
+            # Each <br>/comma separated token is either labelled ("41 ([[Magic]])") or a bare number/range
+            # (Most values are a single bare number, which needs neither the split nor the label scan)
+            base_max_hit = None
+            tokens = _RE_HIT_SPLIT.split(value) if ',' in value or '<' in value else (value,)
+            for token in tokens:
+                labelled = False
+                for match in (_RE_HIT_TOKEN.finditer(token) if '(' in token else ()):
+                    labelled = True
+                    attack_name = _normalize_attack_name(match.group(2) or match.group(3), specific_melee_type)
+                    max_hits[attack_name] = int(match.group(1).replace(',', ''))
+                    log.debug("Added: %s = %s", attack_name, max_hits[attack_name])
+
+                if not labelled:
+                    hit_value = _parse_number(token)
+                    if hit_value is not None and (base_max_hit is None or hit_value > base_max_hit):
+                        base_max_hit = hit_value
+
+            if base_max_hit is None:
+                continue
+
+            # Unlabelled max hits belong to the field's own style, or else to every style the NPC attacks with
+            if attack_type:
+                # Field styles are already canonical; only generic melee takes the NPC's specific melee type
+                if attack_type == 'melee':
+                    attack_type = specific_melee_type or 'melee'
+                max_hits[attack_type] = base_max_hit
+            elif uses_attack_style:
+                if specific_melee_type:
+                    max_hits.setdefault(specific_melee_type, base_max_hit)
+                elif is_melee:
+                    max_hits.setdefault('melee', base_max_hit)
+
+                if is_magic:
+                    max_hits.setdefault('magic', base_max_hit)
+                if is_ranged:
+                    max_hits.setdefault('ranged', base_max_hit)
+            elif is_typeless or len(tokens) > 1:
+                # Unlabelled entries of a <br>/comma list are typeless; only a lone bare value is the NPC's default
+                max_hits.setdefault('typeless', base_max_hit)
+            else:
+                max_hits.setdefault('default', base_max_hit)
 
-        print(f"    [DEBUG] Final max_hits (after default cleanup): {max_hits}")
+        log.debug("Final max_hits: %s", max_hits)
         return max_hits
 
-    def parse_attributes(self, infobox_data: Dict[str, str]) -> List[str]:
+    def lowercase_flags(self, infobox_data: Dict[str, str]) -> Dict[str, str]:
+        """
+        Lowercase the flag/attribute fields once per version, for the parsers that compare them case-insensitively
+        """
+        return {field: infobox_data[field].lower() for field in _FLAG_FIELDS.intersection(infobox_data)}
+
+    def parse_attributes(self, infobox_data: Dict[str, str], lower_data: Optional[Dict[str, str]] = None) -> List[str]:
         """
         Parse monster attributes from infobox
         Common attributes: demon, dragon, undead, fiery, etc.
+        lower_data is the lowercase_flags() mirror of infobox_data, if the caller already built it
         """
-        attributes = []
+        if lower_data is None:
+            lower_data = self.lowercase_flags(infobox_data)
 
-        # Check various attribute fields
-        attribute_fields = ['attributes', 'attribute', 'cat']
+        attributes = []
 
-        for field in attribute_fields:
-            if field in infobox_data:
-                value = infobox_data[field].lower()
+        for field in _ATTRIBUTE_FIELDS:
+            if field in lower_data:
+                value = lower_data[field]
 
                 # Split on commas and clean
-                parts = [part.strip() for part in value.split(',')]
-                attributes.extend([p for p in parts if p])
-
-        # Also check for specific known attributes
-        known_attributes = [
-            'demon', 'dragon', 'undead', 'fiery', 'leafy', 'vampyre',
-            'kalphite', 'shade', 'xerician', 'golem', 'tzhaar'
-        ]
+                attributes.extend(part for part in map(str.strip, value.split(',')) if part)
 
-        for attr in known_attributes:
-            if attr in infobox_data:
-                if infobox_data[attr].lower() in ['yes', 'true', '1']:
-                    if attr not in attributes:
-                        attributes.append(attr)
+        # Also check for specific known attributes (most infoboxes have none of these flags)
+        if not _KNOWN_ATTRIBUTE_SET.isdisjoint(lower_data):
+            listed = set(attributes)
+            for attr in _KNOWN_ATTRIBUTES:
+                if attr not in listed and lower_data.get(attr) in _TRUTHY:
+                    attributes.append(attr)
 
         return attributes
 
-    def parse_immunities(self, infobox_data: Dict[str, str]) -> Dict[str, bool]:
+    def parse_immunities(self, infobox_data: Dict[str, str], lower_data: Optional[Dict[str, str]] = None) -> Dict[str, bool]:
         """
         Parse immunity information
         """
+        if lower_data is None:
+            lower_data = self.lowercase_flags(infobox_data)
+
         immunities = {
             'poison': False,
             'venom': False,
@@ -648,43 +1004,30 @@ class OSRSWikiScraper:
             'thrall': False
         }
 
-        # Check various immunity field names
-        immunity_mappings = {
-            'immunepoison': 'poison',
-            'immunevenom': 'venom',
-            'immunecannon': 'cannon',
-            'immunethrall': 'thrall',
-            'poison immune': 'poison',
-            'venom immune': 'venom',
-            'cannon immune': 'cannon',
-            'thrall immune': 'thrall',
-        }
-
-        for field, immunity_type in immunity_mappings.items():
-            if field in infobox_data:
-                value = infobox_data[field].lower()
-                if value in ['yes', 'true', '1', 'immune']:
-                    immunities[immunity_type] = True
+        # Only look at the immunity fields this infobox actually has
+        for field in _IMMUNITY_FIELDS.keys() & lower_data.keys():
+            if lower_data[field] in _IMMUNITY_TRUTHY:
+                immunities[_IMMUNITY_FIELDS[field]] = True
 
         return immunities
 
-    def parse_venom_type(self, infobox_data: Dict[str, str]) -> Optional[str]:
+    def parse_venom_type(self, infobox_data: Dict[str, str], lower_data: Optional[Dict[str, str]] = None) -> Optional[str]:
         """
         Parse venom type (if the monster is venomous)
         Returns: None, 'venom', 'poison', or specific type
         """
+        if lower_data is None:
+            lower_data = self.lowercase_flags(infobox_data)
+
         # Check if monster is poisonous
-        poison_field = infobox_data.get('poisonous', '').lower()
-        if poison_field in ['yes', 'true', '1']:
+        if lower_data.get('poisonous') in _TRUTHY:
             # Check if it's venom specifically
-            venom_field = infobox_data.get('venom', '').lower()
-            if venom_field in ['yes', 'true', '1']:
+            if lower_data.get('venom') in _TRUTHY:
                 return 'venom'
             return 'poison'
 
         # Check venom field directly
-        venom_field = infobox_data.get('venom', '').lower()
-        if venom_field in ['yes', 'true', '1']:
+        if lower_data.get('venom') in _TRUTHY:
             return 'venom'
 
         return None
@@ -694,12 +1037,13 @@ class OSRSWikiScraper:
         Extract structured NPC data from wiki page
         Returns a list of NPCs since one page can have multiple versions/phases
         """
-        infoboxes = self.parse_infobox_monster(wiki_text)
+        digest = hashlib.blake2b(wiki_text.encode('utf-8'), digest_size=16).digest()
+        infoboxes = self._infobox_cache.get(digest)
+        if infoboxes is None:
+            infoboxes = self._infobox_cache[digest] = self.parse_infobox_monster(wiki_text)
+        debug = log.isEnabledFor(logging.DEBUG)
 
-        print(f"\n{'='*60}")
-        print(f"DEBUG: {page_title}")
-        print(f"{'='*60}")
-        print(f"Found {len(infoboxes)} infoboxes")
+        log.debug("%s: found %s infoboxes", page_title, len(infoboxes))
 
         if not infoboxes:
             return []
@@ -708,46 +1052,41 @@ class OSRSWikiScraper:
 
         for infobox_idx, infobox in enumerate(infoboxes):
             phase_label = infobox.get('phaseLabel')  # e.g., "Normal", "Shielded", "Burrowed"
+            phase_lower = phase_label.lower() if phase_label else ''  # Shared by every version's name
 
-            print(f"\nInfobox {infobox_idx}:")
-            print(f"  Phase Label: {phase_label}")
-            print(f"  Versions: {len(infobox.get('versions', []))}")
+            log.debug("Infobox %s: phase label %s, %s versions", infobox_idx, phase_label, len(infobox.get('versions', [])))
 
             # Each infobox may have multiple versions
             for version_idx, version_data in enumerate(infobox.get('versions', [])):
-                print(f"\n  Version {version_idx}:")
-                print(f"    Version Number: {version_data.get('versionNumber')}")
-                print(f"    Version Name: {version_data.get('versionName')}")
-                print(f"    Has 'max hit' key: {'max hit' in version_data}")
-                print(f"    Has 'attack style' key: {'attack style' in version_data}")
-
-                if 'max hit' in version_data:
-                    print(f"    Max hit raw value: {version_data['max hit'][:150]}...")
-                if 'attack style' in version_data:
-                    print(f"    Attack style: {version_data['attack style']}")
+                if debug:
+                    log.debug("Version %s: number %s, name '%s'", version_idx,
+                              version_data.get('versionNumber'), version_data.get('versionName'))
+                    log.debug("Max hit raw value: %.150s", version_data.get('max hit'))
+                    log.debug("Attack style: %s", version_data.get('attack style'))
 
                 # Parse max hits for different attack styles
                 max_hits = self.parse_max_hit(version_data)
 
-                print(f"    Parsed max_hits: {max_hits}")
+                log.debug("Parsed max_hits: %s", max_hits)
 
                 if not max_hits:
                     # Skip versions with no max hit data
-                    print(f"    ✗ Skipping - no max hits parsed")
+                    log.debug("✗ Skipping - no max hits parsed")
                     continue
 
                 # Create min hits (all default to 0, users can curate later)
                 min_hits = {style: 0 for style in max_hits.keys()}
 
-                # Parse additional properties
-                attributes = self.parse_attributes(version_data)
-                immunities = self.parse_immunities(version_data)
-                venom_type = self.parse_venom_type(version_data)
+                # Parse additional properties (sharing one lowercased copy of the flag fields)
+                lower_data = self.lowercase_flags(version_data)
+                attributes = self.parse_attributes(version_data, lower_data)
+                immunities = self.parse_immunities(version_data, lower_data)
+                venom_type = self.parse_venom_type(version_data, lower_data)
 
                 # Parse elemental weakness
                 elemental_weakness = None
                 weakness_type = version_data.get('elementalweaknesstype', '')
-                weakness_percent = self.parse_number(version_data.get('elementalweaknesspercent', ''))
+                weakness_percent = _parse_number(version_data.get('elementalweaknesspercent', ''))
                 if weakness_type and weakness_percent:
                     elemental_weakness = {
                         'type': weakness_type,
@@ -761,167 +1100,192 @@ class OSRSWikiScraper:
                 # Construct full name with phase label if present
                 base_name = version_data.get('name', page_title)
 
-                # Build full name: base_name + (phase_label) + (bucket_name)
-                name_parts = [base_name]
+                # Build full name: base_name + (phase_label) + (bucket_name), keeping a lowercase copy for the checks
+                full_name = base_name
+                full_name_lower = base_name.lower()
 
                 # Add phase label if it exists and isn't already in the base name
-                if phase_label and phase_label.lower() not in base_name.lower():
-                    name_parts.append(f"({phase_label})")
+                if phase_lower and phase_lower not in full_name_lower:
+                    full_name = f"{full_name} ({phase_label})"
+                    full_name_lower = f"{full_name_lower} ({phase_lower})"
 
                 # Add bucket name if it's different from version name and not already included
-                if bucket_name and bucket_name != base_name and (not phase_label or bucket_name.lower() != phase_label.lower()):
-                    # Check if bucket_name is already in the constructed name
-                    constructed_so_far = ' '.join(name_parts)
-                    if bucket_name.lower() not in constructed_so_far.lower():
-                        name_parts.append(f"- {bucket_name}")
-
-                full_name = ' '.join(name_parts)
+                if bucket_name and bucket_name != base_name:
+                    bucket_lower = bucket_name.lower()
+                    if bucket_lower != phase_lower and bucket_lower not in full_name_lower:
+                        full_name = f"{full_name} - {bucket_name}"
 
-                # Extract NPC IDs (can be comma-separated)
-                npc_id = version_data.get('id', '')
-
-                # Extract other useful data
-                npc_data = {
+                # Values computed above; everything else in _NPC_FIELDS is read straight from the infobox
+                computed = {
                     'name': full_name,
                     'baseName': base_name,
                     'phase': phase_label,
                     'version': bucket_name,
-                    'id': npc_id,
-                    'combatLevel': self.parse_number(version_data.get('combat', '')),
-                    'hitpoints': self.parse_number(version_data.get('hitpoints', '')),
-                    'size': self.parse_number(version_data.get('size', '')),
                     'maxHit': max_hits,
                     'minHit': min_hits,
-                    'attackSpeed': self.parse_number(version_data.get('attack speed', '')),
-                    'attackStyle': version_data.get('attack style', ''),
-                    'aggressive': version_data.get('aggressive', '').lower() == 'yes',
-
-                    # Poison/Venom properties
-                    'poisonous': version_data.get('poisonous', '').lower() == 'yes',
+                    'aggressive': lower_data.get('aggressive') == 'yes',
+                    'poisonous': lower_data.get('poisonous') == 'yes',
                     'venomType': venom_type,
-
-                    # Attributes (demon, dragon, undead, etc.)
                     'attributes': attributes,
-
-                    # Immunities
                     'immunities': immunities,
-
-                    # Combat stats
-                    'attackLevel': self.parse_number(version_data.get('att', '')),
-                    'strengthLevel': self.parse_number(version_data.get('str', '')),
-                    'defenceLevel': self.parse_number(version_data.get('def', '')),
-                    'magicLevel': self.parse_number(version_data.get('mage', '')),
-                    'rangedLevel': self.parse_number(version_data.get('range', '')),
-
-                    # Offensive bonuses
-                    'attackBonus': self.parse_number(version_data.get('attbns', '')),
-                    'strengthBonus': self.parse_number(version_data.get('strbns', '')),
-                    'rangedAttackBonus': self.parse_number(version_data.get('arange', '')),
-                    'rangedStrengthBonus': self.parse_number(version_data.get('rngbns', '')),
-                    'magicAttackBonus': self.parse_number(version_data.get('amagic', '')),
-                    'magicStrengthBonus': self.parse_number(version_data.get('mbns', '')),
-
-                    # Defensive bonuses
-                    'stabDefence': self.parse_number(version_data.get('dstab', '')),
-                    'slashDefence': self.parse_number(version_data.get('dslash', '')),
-                    'crushDefence': self.parse_number(version_data.get('dcrush', '')),
-                    'magicDefence': self.parse_number(version_data.get('dmagic', '')),
-                    'rangedDefence': self.parse_number(version_data.get('drange', '')),
-
-                    # Ammo-specific defences
-                    'lightAmmoDefence': self.parse_number(version_data.get('dlight', '')),
-                    'standardAmmoDefence': self.parse_number(version_data.get('dstandard', '')),
-                    'heavyAmmoDefence': self.parse_number(version_data.get('dheavy', '')),
-
-                    # Elemental weakness
                     'elementalWeakness': elemental_weakness,
-
-                    # Slayer info
-                    'slayerLevel': self.parse_number(version_data.get('slaylvl', '')),
-                    'slayerXp': self.parse_number(version_data.get('slayxp', '')),
-
-                    # Metadata
                     'wikiPage': page_title,
-                    'examine': version_data.get('examine', ''),
                 }
 
-                # Only include non-null values (but keep empty lists/dicts)
+                # Build the NPC in output order, only including non-null values (but keeping empty lists/dicts)
                 cleaned_data = {}
-                for k, v in npc_data.items():
-                    if v is not None and v != '':
-                        cleaned_data[k] = v
-                    elif isinstance(v, (list, dict)) and len(v) > 0:
-                        cleaned_data[k] = v
+                for key, field, is_number in _NPC_FIELDS:
+                    if field is None:
+                        value = computed[key]
+                    elif is_number:
+                        value = _parse_number(version_data.get(field))
+                    else:
+                        value = version_data.get(field)
+
+                    if value is not None and value != '':
+                        cleaned_data[key] = value
 
                 all_npcs.append(cleaned_data)
-                print(f"    ✓ Created NPC: {full_name}")
+                log.debug("✓ Created NPC: %s", full_name)
 
         return all_npcs
 
     def scrape_all_npcs(self, limit: Optional[int] = None, test_pages: Optional[List[str]] = None):
         """
         Scrape all NPC pages and extract data
+        Category titles are streamed, so pages are fetched and parsed while the listing is still being paged through
         """
         if test_pages:
-            pages = test_pages
-            print(f"Testing with specific pages: {test_pages}")
+            pages = iter(test_pages)
+            log.info("Testing with specific pages: %s", test_pages)
         else:
-            pages = self.get_all_npc_pages()
-            if limit:
-                pages = pages[:limit]
-
-        total = len(pages)
-
-        for i, page_title in enumerate(pages, 1):
-            print(f"\n{'='*60}")
-            print(f"Processing {i}/{total}: {page_title}")
-            print(f"{'='*60}")
-
-            try:
-                wiki_text = self.get_page_content(page_title)
-
-                if wiki_text:
-                    npc_list = self.extract_npc_data(page_title, wiki_text)
-
-                    if npc_list:
-                        for npc_data in npc_list:
-                            if npc_data.get('maxHit'):
-                                # Use NPC ID(s) as key, or generate unique key
-                                npc_ids = npc_data.get('id', '')
-                                npc_name = npc_data.get('name', page_title)
-                                version = npc_data.get('version', '')
-                                phase = npc_data.get('phase', '')
-
-                                # Create a unique key with version info
-                                if npc_ids:
-                                    # Use first ID as primary key
-                                    primary_id = npc_ids.split(',')[0].strip()
-                                    if version or phase:
-                                        unique_key = f"{primary_id}_{version}_{phase}".replace(' ', '_').replace('-', '_')
-                                    else:
-                                        unique_key = f"{primary_id}"
+            log.info("Fetching NPC pages from Category:Monsters...")
+            pages = islice(self.iter_npc_pages(), limit) if limit else self.iter_npc_pages()
+
+        self._journal = open(self.journal_path, 'wb') if self.journal_path else None
+        if self.parse_processes > 0:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_processes, initializer=_init_parse_worker,
+                                                   mp_context=multiprocessing.get_context(_PARSE_START_METHOD))
+
+        # Batches are fetched in worker threads (paced by the rate limiter), but results are
+        # consumed in page order so parsing and self.npcs stay on this thread
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            pending = deque()
+            done = 0
+
+            while batch := list(islice(pages, PAGES_PER_REQUEST)):
+                pending.append((batch, executor.submit(self.get_pages_content, batch)))
+
+                # Handle whatever has already arrived before waiting on the next listing page
+                while pending and pending[0][1].done():
+                    done = self._process_batch(*pending.popleft(), done)
+
+            while pending:
+                done = self._process_batch(*pending.popleft(), done)
+        finally:
+            # On an error or Ctrl-C, batches still queued are dropped rather than fetched before it surfaces
+            executor.shutdown(cancel_futures=True)
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(cancel_futures=True)
+                self._parse_pool = None
+
+        log.info("Processed %s NPC pages", done)
+
+    def _process_batch(self, batch: List[str], future: Future, done: int) -> int:
+        """
+        Process the pages of one fetched batch, in order
+        Returns the running count of processed pages
+        """
+        try:
+            contents = future.result()
+        except Exception as e:
+            log.error("✗ Error fetching %s pages: %s", len(batch), e)
+            contents = {}
+
+        # With parse processes, the whole batch is handed out before the results are stored in page order
+        parsed = {}
+        if self._parse_pool is not None:
+            parsed = {
+                page_title: self._parse_pool.submit(_extract_npc_data_in_worker, page_title, wiki_text)
+                for page_title, wiki_text in contents.items() if wiki_text
+            }
+
+        for page_title in batch:
+            done += 1
+            log.info("Processing %s: %s", done, page_title)
+
+            self.process_page(page_title, contents.get(page_title), parsed.get(page_title))
+
+        if self._journal is not None:
+            self._journal.flush()
+
+        return done
+
+    def process_page(self, page_title: str, wiki_text: Optional[str], parsed: Optional[Future] = None):
+        """
+        Extract the NPCs from one fetched page and add them to self.npcs
+        parsed is the page's pending extract_npc_data result from a parse worker process, if there is one
+        """
+        try:
+            if wiki_text:
+                npc_list = parsed.result() if parsed is not None else self.extract_npc_data(page_title, wiki_text)
+
+                if npc_list:
+                    for npc_data in npc_list:
+                        if npc_data.get('maxHit'):
+                            # Use NPC ID(s) as key, or generate unique key
+                            npc_ids = npc_data.get('id', '')
+                            npc_name = npc_data.get('name', page_title)
+                            version = npc_data.get('version', '')
+                            phase = npc_data.get('phase', '')
+
+                            # Create a unique key with version info
+                            if npc_ids:
+                                # Use first ID as primary key
+                                primary_id = npc_ids.split(',')[0].strip()
+                                if version or phase:
+                                    unique_key = f"{primary_id}_{version}_{phase}".translate(_ID_KEY_TRANS)
                                 else:
-                                    # Fallback to name-based key
-                                    unique_key = npc_name.replace(' ', '_').replace('(', '').replace(')', '').replace('-', '_')
+                                    unique_key = f"{primary_id}"
+                            else:
+                                # Fallback to name-based key
+                                unique_key = npc_name.translate(_NAME_KEY_TRANS)
 
-                                self.npcs[unique_key] = npc_data
-                                print(f"  ✓ Extracted: {npc_name} (Max hits: {npc_data['maxHit']})")
-                    else:
-                        print(f"  ✗ No NPC data found")
+                            self.npcs[unique_key] = npc_data
+                            if self._journal is not None:
+                                self._journal.write(_json_dumps_line({unique_key: npc_data}))
+                            log.info("  ✓ Extracted: %s (Max hits: %s)", npc_name, npc_data['maxHit'])
                 else:
-                    print(f"  ✗ Could not fetch page content")
+                    log.info("  ✗ No NPC data found")
+            else:
+                log.warning("  ✗ Could not fetch page content for %s", page_title)
+
+        except Exception as e:
+            # The traceback is only formatted for -vv; otherwise one line per failed page
+            log.error("  ✗ Error processing %s: %s", page_title, e, exc_info=log.isEnabledFor(logging.DEBUG))
 
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                import traceback
-                traceback.print_exc()
+    def load_journal(self, path: str = JOURNAL_PATH):
+        """
+        Load NPCs from a journal written by scrape_all_npcs (later lines win)
+        A partly written last line from an interrupted run is ignored
+        """
+        with open(path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    self.npcs.update(_json_loads(line))
+                except ValueError:
+                    log.warning("Ignoring unreadable journal line %s in %s", line_number, path)
 
-            # Rate limiting
-            time.sleep(RATE_LIMIT_DELAY)
+        log.info("Loaded %s NPCs from %s", len(self.npcs), path)
 
-    def save_database(self, filename: str = 'npc_database.json'):
+    def save_database(self, filename: str = 'npc_database.json', compact: bool = False):
         """
         Save the scraped data to JSON file
+        compact writes it on a single line without indentation (about half the size, and faster to serialize)
         """
         output = {
             '_metadata': {
@@ -934,10 +1298,11 @@ class OSRSWikiScraper:
             'npcs': self.npcs
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Serialized in one call and written as UTF-8 bytes (same layout as json.dump with indent=2, unless compact)
+        with open(filename, 'wb') as f:
+            f.write(_json_dumps_line(output) if compact else _json_dumps_pretty(output))
 
-        print(f"\n✓ Saved {len(self.npcs)} NPCs to {filename}")
+        log.info("✓ Saved %s NPCs to %s", len(self.npcs), filename)
 
     def print_summary(self):
         """
@@ -949,50 +1314,126 @@ class OSRSWikiScraper:
         print(f"Total NPCs extracted: {len(self.npcs)}")
 
         # Count attack styles
-        attack_styles = defaultdict(int)
-        for npc in self.npcs.values():
-            for style in npc.get('maxHit', {}).keys():
-                attack_styles[style] += 1
+        attack_styles = Counter(chain.from_iterable(npc.get('maxHit', ()) for npc in self.npcs.values()))
 
         print("\nAttack Style Distribution:")
         for style, count in sorted(attack_styles.items()):
             print(f"  {style}: {count} NPCs")
 
-        # List all NPCs
-        print("\nAll extracted NPCs:")
-        for i, (npc_id, npc_data) in enumerate(self.npcs.items()):
-            print(f"  {npc_data.get('name', npc_id)}: {npc_data.get('maxHit', {})}")
+        # List all NPCs (thousands of lines on a full run, so only with -v)
+        if log.isEnabledFor(logging.INFO):
+            log.info("\nAll extracted NPCs:")
+            for npc_id, npc_data in self.npcs.items():
+                log.info("  %s: %s", npc_data.get('name', npc_id), npc_data.get('maxHit', {}))
 
         print("="*60)
 
 
+# Parse worker process state: each process gets its own scraper, used only for its parsing methods
+_worker_scraper: Optional[OSRSWikiScraper] = None
+
+# Workers start after the fetch threads are running, and forking a multi-threaded process can deadlock the child
+_PARSE_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def _init_parse_worker():
+    global _worker_scraper
+    _worker_scraper = OSRSWikiScraper(cache_path=None)
+
+
+def _extract_npc_data_in_worker(page_title: str, wiki_text: str) -> List[Dict[str, Any]]:
+    """
+    extract_npc_data for a parse worker process (module-level so the process pool can pickle it)
+    """
+    return _worker_scraper.extract_npc_data(page_title, wiki_text)
+
+
+def _positive_int(value: str) -> int:
+    """
+    argparse type for counts that must be at least 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """
+    argparse type for counts that may be 0
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer, got {value!r}")
+    return number
+
+
 def main():
     """
     Main execution
     """
+    parser = argparse.ArgumentParser(description='Scrape NPC combat data from the OSRS Wiki')
+    parser.add_argument('--force-refresh', action='store_true',
+                        help='re-download every page instead of reusing unchanged pages from the cache')
+    parser.add_argument('--from-journal', action='store_true',
+                        help=f'rebuild the database from {JOURNAL_PATH} (e.g. after an interrupted run) instead of scraping')
+    parser.add_argument('--no-revalidate', dest='revalidate', action='store_false',
+                        help='use cached pages without checking the wiki for newer revisions')
+    parser.add_argument('--compact', action='store_true',
+                        help='write npc_database.json without indentation')
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help='show per-page progress (-v) or parser debug output (-vv)')
+    parser.add_argument('--processes', type=_non_negative_int, default=0,
+                        help='parse pages in this many worker processes (default: parse in the main process)')
+    parser.add_argument('--workers', type=_positive_int, default=MAX_CONCURRENT_REQUESTS,
+                        help=f'page fetches allowed in flight at once (default: {MAX_CONCURRENT_REQUESTS})')
+    args = parser.parse_args()
+    if args.from_journal and not os.path.isfile(JOURNAL_PATH):
+        parser.error(f"--from-journal: {JOURNAL_PATH} not found (it is written by a previous scrape)")
+
+    # Progress and parser debug output are only formatted when -v/-vv lower the level
+    log_level = {0: logging.WARNING, 1: logging.INFO}.get(args.verbose, logging.DEBUG)
+    logging.basicConfig(level=log_level, format='%(message)s')
+
     print("="*60)
     print("OSRS Wiki NPC Database Scraper - TEST MODE")
     print("="*60)
     print(f"API URL: {WIKI_API_URL}")
     print(f"User-Agent: {USER_AGENT}")
-    print(f"Rate Limit: {RATE_LIMIT_DELAY}s between requests")
+    print(f"Rate Limit: {RATE_LIMIT_DELAY}s between requests, {args.workers} workers")
+    cache_mode = ' (refreshing)' if args.force_refresh else '' if args.revalidate else ' (not revalidated)'
+    print(f"Page Cache: {CACHE_DB_PATH}{cache_mode}")
     print("="*60)
     print()
 
-    scraper = OSRSWikiScraper()
+    scraper = OSRSWikiScraper(force_refresh=args.force_refresh, max_workers=args.workers,
+                              revalidate=args.revalidate, journal_path=JOURNAL_PATH,
+                              parse_processes=args.processes)
 
     # Test with just Vorkath and Doom of Mokhaiotl
     test_pages = ['Zulrah','Vorkath']
 
-    scraper.scrape_all_npcs()
+    try:
+        if args.from_journal:
+            scraper.load_journal()
+        else:
+            scraper.scrape_all_npcs()
+    finally:
+        scraper.close()
 
     # Print summary
     scraper.print_summary()
 
     # Save to file
-    scraper.save_database('npc_database.json')
+    scraper.save_database('npc_database.json', compact=args.compact)
 
-    print("\nDone! Check the debug output above to see what's happening.")
+    print("\nDone! Run with -v for per-page progress, or -vv for the parser's debug output.")
 
 
 if __name__ == '__main__':